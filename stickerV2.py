@@ -1,211 +1,460 @@
-import os
-import json
-import requests
-from PIL import Image
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
-
-# -----------------------------------------------------------------------------
-# CONFIGURABLE SETTINGS
-# -----------------------------------------------------------------------------
-# This script requires the 'requests' and 'Pillow' libraries.
-# You can install them using pip:
-# pip install requests Pillow
-
-# --- Telegram Bot Token ---
-# Your Telegram bot token.
-BOT_TOKEN = "YOUR_BOT_TOKEN"
-
-# --- Sticker Pack Link ---
-# The link to the Telegram sticker pack you want to download.
-STICKER_PACK_LINK = "https://t.me/addstickers/UtyaTheDuck"
-
-# --- Output Folder ---
-# The folder where the downloaded stickers will be saved.
-OUTPUT_FOLDER = "stickers"
-# The name of the file to store the bot token.
-CONFIG_FILE = "config.json"
-
-
-# -----------------------------------------------------------------------------
-# SCRIPT LOGIC (No need to edit below this line)
-# -----------------------------------------------------------------------------
-
-class TelegramStickerDownloader:
-    """
-    A class to download and convert Telegram sticker packs to PNG images.
-    """
-
-    def __init__(self, bot_token):
-        """
-        Initializes the downloader with a Telegram bot token.
-        """
-        self.bot_token = bot_token
-        self.api_url = f"https://api.telegram.org/bot{self.bot_token}/"
-        self.console = Console()
-
-    def _make_api_request(self, endpoint, params=None):
-        """
-        Makes a request to the Telegram Bot API.
-        """
-        url = self.api_url + endpoint
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            self.console.print(f"[bold red]Error making API request:[/bold red] {e}")
-            return None
-
-    def _get_sticker_set(self, pack_name):
-        """
-        Retrieves information about a sticker pack.
-        """
-        params = {'name': pack_name}
-        return self._make_api_request('getStickerSet', params)
-
-    def _get_file_info(self, file_id):
-        """
-        Retrieves file information for a given file ID.
-        """
-        params = {'file_id': file_id}
-        return self._make_api_request('getFile', params)
-
-    def _download_file(self, file_path, save_path, progress, task_id):
-        """
-        Downloads a file and updates the progress bar.
-        """
-        url = f"https://api.telegram.org/file/bot{self.bot_token}/{file_path}"
-        try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            total_size = int(response.headers.get('content-length', 0))
-            progress.update(task_id, total=total_size)
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    progress.update(task_id, advance=len(chunk))
-        except requests.exceptions.RequestException as e:
-            self.console.print(f"[bold red]Error downloading file:[/bold red] {e}")
-
-    def _convert_webp_to_png(self, webp_path, png_path):
-        """
-        Converts a WEBP image to PNG format.
-        """
-        try:
-            with Image.open(webp_path) as img:
-                img.save(png_path, 'PNG')
-            os.remove(webp_path)
-        except Exception as e:
-            self.console.print(f"[bold red]Error converting image:[/bold red] {e}")
-
-    def download_sticker_pack(self, sticker_pack_link, output_folder):
-        """
-        Downloads all stickers from a sticker pack link.
-        """
-        pack_name = sticker_pack_link.split('/')[-1]
-        
-        with self.console.status("[bold green]Fetching sticker pack info...[/bold green]"):
-            pack_info = self._get_sticker_set(pack_name)
-
-        if not pack_info or not pack_info.get("ok"):
-            self.console.print("[bold red]Could not retrieve sticker pack information. Please check the link and your bot token.[/bold red]")
-            return
-
-        pack_folder = os.path.join(output_folder, pack_name)
-        os.makedirs(pack_folder, exist_ok=True)
-
-        self.console.print(Panel(f"[bold cyan]Downloading Sticker Pack:[/bold cyan] [yellow]{pack_info['result']['title']}[/yellow]", border_style="green"))
-        
-        stickers = pack_info['result']['stickers']
-        with Progress(
-            TextColumn("[bold blue]{task.description}", justify="right"),
-            BarColumn(bar_width=None),
-            "[progress.percentage]{task.percentage:>3.1f}%",
-            "•",
-            TimeElapsedColumn(),
-            "•",
-            TimeRemainingColumn(),
-            console=self.console
-        ) as progress:
-            download_task = progress.add_task("[green]Downloading[/green]", total=len(stickers))
-            convert_task = progress.add_task("[magenta]Converting[/magenta]", total=len(stickers))
-
-            for sticker in stickers:
-                file_info = self._get_file_info(sticker['file_id'])
-                if file_info and file_info.get("ok"):
-                    file_path = file_info['result']['file_path']
-                    file_extension = os.path.splitext(file_path)[1]
-                    
-                    # --- FIX: Use file_unique_id for unique filenames ---
-                    file_unique_id = sticker['file_unique_id']
-                    # Sanitize emoji for filename, keeping it simple
-                    sanitized_emoji = ''.join(c for c in sticker.get('emoji', 'sticker') if c.isalnum())
-                    
-                    # Generate a unique filename using the unique ID
-                    file_name = f"{file_unique_id}_{sanitized_emoji}{file_extension}"
-                    webp_save_path = os.path.join(pack_folder, file_name)
-
-                    self._download_file(file_path, webp_save_path, progress, download_task)
-                    
-                    # Convert to PNG using the same unique naming scheme
-                    if file_extension.lower() == ".webp":
-                        png_file_name = f"{file_unique_id}_{sanitized_emoji}.png"
-                        png_save_path = os.path.join(pack_folder, png_file_name)
-                        self._convert_webp_to_png(webp_save_path, png_save_path)
-                    
-                    progress.update(convert_task, advance=1)
-                progress.update(download_task, advance=1)
-
-
-        self.console.print(Panel("[bold green]Sticker pack download complete![/bold green]", border_style="green"))
-
-def load_token():
-    """Loads the bot token from the config file."""
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                return config.get("bot_token")
-        except json.JSONDecodeError:
-            return None
-    return None
-
-def save_token(token):
-    """Saves the bot token to the config file."""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump({"bot_token": token}, f)
-
-def main():
-    """Main function to run the sticker downloader."""
-    console = Console()
-    console.print(Panel(
-        "[bold magenta]TG Sticker Downloader[/bold magenta]",
-        title="[bold blue]Welcome![/bold blue]",
-        subtitle="[bold red]By Johny[/bold red]",
-        border_style="bold purple",
-        expand=False
-    ))
-
-    bot_token = load_token()
-    if not bot_token:
-        console.print("[yellow]No saved bot token found.[/yellow]")
-        bot_token = Prompt.ask("[bold yellow]Please enter your Telegram Bot Token[/bold yellow]")
-        save_token(bot_token)
-        console.print("[bold green]Bot token saved for future sessions.[/bold green]")
-    else:
-        console.print("[bold green]Saved bot token loaded.[/bold green]")
-
-    downloader = TelegramStickerDownloader(bot_token)
-    
-    while True:
-        sticker_pack_link = Prompt.ask("\n[bold yellow]Enter the sticker pack link (or type 'quit' to exit)[/bold yellow]")
-        if sticker_pack_link.lower() == 'quit':
-            break
-        
-        downloader.download_sticker_pack(sticker_pack_link, OUTPUT_FOLDER)
-
-if __name__ == '__main__':
+import asyncio
+import gzip
+import io
+import os
+import json
+import time
+import zipfile
+import httpx
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+
+# Optional: libvips converts WEBP to PNG faster than Pillow and with less
+# memory. Used automatically when installed (pip install pyvips).
+try:
+    import pyvips
+except ImportError:
+    pyvips = None
+
+# Optional: rlottie renders animated .tgs stickers to PNG. Used
+# automatically when installed (pip install rlottie-python).
+try:
+    from rlottie_python import LottieAnimation
+except ImportError:
+    LottieAnimation = None
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.prompt import Prompt
+from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
+
+# -----------------------------------------------------------------------------
+# CONFIGURABLE SETTINGS
+# -----------------------------------------------------------------------------
+# This script requires the 'httpx[http2]' and 'Pillow' libraries.
+# You can install them using pip:
+# pip install "httpx[http2]" Pillow
+
+# --- Telegram Bot Token ---
+# Your Telegram bot token.
+BOT_TOKEN = "YOUR_BOT_TOKEN"
+
+# --- Sticker Pack Link ---
+# The link to the Telegram sticker pack you want to download.
+STICKER_PACK_LINK = "https://t.me/addstickers/UtyaTheDuck"
+
+# --- Output Folder ---
+# The folder where the downloaded stickers will be saved.
+OUTPUT_FOLDER = "stickers"
+# The name of the file to store the bot token.
+CONFIG_FILE = "config.json"
+# How many stickers to fetch at the same time. Downloads are network-bound,
+# so overlapping them speeds up large packs considerably.
+MAX_WORKERS = 16
+# How long (in seconds) a cached pack description stays valid. Re-running
+# the script within this window skips the getStickerSet request entirely.
+PACK_CACHE_MAX_AGE = 24 * 60 * 60
+# Save each pack as a single uncompressed .zip archive instead of a folder
+# full of PNG files. One archive means one filesystem entry per pack, which
+# is much cheaper on large packs (PNGs don't benefit from re-compression).
+SAVE_AS_ZIP = False
+
+
+# -----------------------------------------------------------------------------
+# SCRIPT LOGIC (No need to edit below this line)
+# -----------------------------------------------------------------------------
+
+def _convert_webp_to_png(webp_bytes, png_path=None):
+    """
+    Encodes downloaded WEBP bytes as PNG, writing to png_path or
+    returning the encoded bytes when no path is given (ZIP mode).
+
+    Works on in-memory bytes so the WEBP never touches the disk.
+    Kept at module level so it can be pickled into the conversion
+    worker processes.
+    """
+    # zlib level 1 encodes several times faster than the default level 6
+    # at the cost of slightly larger files -- a fine trade for stickers
+    # stored locally.
+    if pyvips is not None:
+        # access='sequential' streams the image through libvips
+        # instead of decoding it fully into memory first.
+        image = pyvips.Image.new_from_buffer(webp_bytes, '', access='sequential')
+        if png_path is None:
+            return image.write_to_buffer('.png', compression=1)
+        image.write_to_file(str(png_path), compression=1)
+    else:
+        with Image.open(io.BytesIO(webp_bytes)) as img:
+            if png_path is None:
+                buffer = io.BytesIO()
+                img.save(buffer, 'PNG', compress_level=1, optimize=False)
+                return buffer.getvalue()
+            img.save(png_path, 'PNG', compress_level=1, optimize=False)
+    return None
+
+
+def _convert_tgs_to_png(tgs_bytes, png_path=None):
+    """
+    Renders the first frame of an animated .tgs sticker as PNG, writing
+    to png_path or returning the encoded bytes when no path is given
+    (ZIP mode).
+
+    .tgs files are gzipped Lottie JSON; rlottie does the rendering.
+    Kept at module level so it can be pickled into the conversion
+    worker processes.
+    """
+    animation = LottieAnimation.from_data(gzip.decompress(tgs_bytes).decode('utf-8'))
+    if png_path is None:
+        buffer = io.BytesIO()
+        animation.render_pillow_frame(frame_num=0).save(buffer, 'PNG', compress_level=1, optimize=False)
+        return buffer.getvalue()
+    animation.save_frame(str(png_path), frame_num=0)
+    return None
+
+
+class TelegramStickerDownloader:
+    """
+    A class to download and convert Telegram sticker packs to PNG images.
+    """
+
+    def __init__(self, bot_token):
+        """
+        Initializes the downloader with a Telegram bot token.
+        """
+        self.bot_token = bot_token
+        self.api_url = f"https://api.telegram.org/bot{self.bot_token}/"
+        self.console = Console()
+        # Some packs list the same file under several emoji entries;
+        # remembering getFile answers avoids repeating those round-trips.
+        self._file_info_cache = {}
+
+    async def _make_api_request(self, client, endpoint, params=None):
+        """
+        Makes a request to the Telegram Bot API.
+        """
+        url = self.api_url + endpoint
+        try:
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            self.console.print(f"[bold red]Error making API request:[/bold red] {e}")
+            return None
+
+    async def _get_sticker_set(self, client, pack_name):
+        """
+        Retrieves information about a sticker pack.
+        """
+        params = {'name': pack_name}
+        return await self._make_api_request(client, 'getStickerSet', params)
+
+    def _load_cached_pack_info(self, cache_path):
+        """
+        Loads a cached getStickerSet response if it is still fresh,
+        returning None when missing, stale or unreadable.
+        """
+        try:
+            if time.time() - os.path.getmtime(cache_path) < PACK_CACHE_MAX_AGE:
+                with open(cache_path, 'r') as f:
+                    return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass
+        return None
+
+    async def _get_file_info(self, client, file_id):
+        """
+        Retrieves file information for a given file ID. Successful
+        responses are cached so duplicate file IDs in a pack only cost
+        one request.
+        """
+        file_info = self._file_info_cache.get(file_id)
+        if file_info is not None:
+            return file_info
+        params = {'file_id': file_id}
+        file_info = await self._make_api_request(client, 'getFile', params)
+        if file_info and file_info.get("ok"):
+            self._file_info_cache[file_id] = file_info
+        return file_info
+
+    async def _download_bytes(self, client, file_path):
+        """
+        Downloads a file into memory and returns its bytes, or None on error.
+        """
+        url = f"https://api.telegram.org/file/bot{self.bot_token}/{file_path}"
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.content
+        except httpx.HTTPError as e:
+            self.console.print(f"[bold red]Error downloading file:[/bold red] {e}")
+            return None
+
+    async def _download_file(self, client, file_path, save_path):
+        """
+        Downloads a file to the given path.
+        """
+        # Stickers are at most a few hundred KB, so the whole body is
+        # fetched in one go and written with a single write().
+        data = await self._download_bytes(client, file_path)
+        if data is not None:
+            with open(save_path, 'wb') as f:
+                # Reserve the full size up front so the filesystem can
+                # allocate one contiguous extent instead of growing the
+                # file as it is written.
+                try:
+                    os.posix_fallocate(f.fileno(), 0, len(data))
+                except (AttributeError, OSError):
+                    # posix_fallocate is missing on Windows and refused by
+                    # some filesystems; pre-extending is the next best thing.
+                    f.truncate(len(data))
+                f.write(data)
+
+    async def _process_one_sticker(self, client, semaphore, convert_pool, sticker,
+                                   pack_folder, zip_file, zip_names, progress,
+                                   download_task, convert_task):
+        """
+        Fetches and downloads a single sticker, then runs its conversion
+        on the process pool. The semaphore caps how many requests are in
+        flight at once. When zip_file is given, results are appended to
+        the archive (zip_names holds its current entries) instead of
+        being written as individual files.
+        """
+        # Use file_unique_id for unique filenames
+        file_unique_id = sticker['file_unique_id']
+        # Sanitize emoji for filename, keeping it simple. filter() runs the
+        # isalnum check in C rather than in an interpreted genexp.
+        sanitized_emoji = ''.join(filter(str.isalnum, sticker.get('emoji', 'sticker')))
+        png_name = f"{file_unique_id}_{sanitized_emoji}.png"
+        png_save_path = pack_folder / png_name
+
+        # Already converted on a previous run -- nothing to fetch.
+        already_done = png_name in zip_names if zip_file is not None else png_save_path.exists()
+        if already_done:
+            progress.update(download_task, advance=1)
+            progress.update(convert_task, advance=1)
+            return
+
+        convert_job = None
+        raw_job = None
+        async with semaphore:
+            # Some sticker objects already carry their file path in the
+            # getStickerSet response; only pay the getFile round-trip when
+            # it is missing.
+            file_path = sticker.get('file_path')
+            if not file_path:
+                file_info = await self._get_file_info(client, sticker['file_id'])
+                if not file_info or not file_info.get("ok"):
+                    progress.update(download_task, advance=1)
+                    return
+                file_path = file_info['result']['file_path']
+
+            file_extension = os.path.splitext(file_path)[1].lower()
+
+            # Convertible stickers are downloaded into memory and rendered
+            # straight from the buffer, so the source file never hits the
+            # disk: .webp goes through pyvips/Pillow, .tgs through rlottie.
+            if file_extension == ".webp":
+                converter = _convert_webp_to_png
+            elif file_extension == ".tgs" and LottieAnimation is not None:
+                converter = _convert_tgs_to_png
+            else:
+                converter = None
+
+            if converter is not None:
+                data = await self._download_bytes(client, file_path)
+                if data is None:
+                    progress.update(download_task, advance=1)
+                    return
+                convert_job = (converter, data)
+            else:
+                # .webm videos (and .tgs without rlottie installed) are
+                # stored as-is, reusing the PNG name with the original
+                # extension. The .png-only check above cannot see these,
+                # so test the raw name here before downloading again.
+                save_path = png_save_path.with_suffix(file_extension)
+                raw_done = save_path.name in zip_names if zip_file is not None else save_path.exists()
+                if raw_done:
+                    progress.update(download_task, advance=1)
+                    progress.update(convert_task, advance=1)
+                    return
+                if zip_file is not None:
+                    data = await self._download_bytes(client, file_path)
+                    if data is None:
+                        progress.update(download_task, advance=1)
+                        return
+                    raw_job = (save_path.name, data)
+                else:
+                    await self._download_file(client, file_path, save_path)
+
+        progress.update(download_task, advance=1)
+
+        # Rendering is CPU-bound, so it runs in a separate process
+        # while the event loop keeps the remaining downloads moving.
+        # All ZipFile writes happen here on the event-loop thread, so the
+        # (not thread-safe) archive needs no locking.
+        if convert_job is not None:
+            converter, data = convert_job
+            loop = asyncio.get_running_loop()
+            try:
+                if zip_file is not None:
+                    png_bytes = await loop.run_in_executor(convert_pool, converter, data)
+                    zip_file.writestr(png_name, png_bytes)
+                    zip_names.add(png_name)
+                else:
+                    await loop.run_in_executor(convert_pool, converter, data, png_save_path)
+            except Exception as e:
+                self.console.print(f"[bold red]Error converting image:[/bold red] {e}")
+        elif raw_job is not None:
+            raw_name, data = raw_job
+            zip_file.writestr(raw_name, data)
+            zip_names.add(raw_name)
+        progress.update(convert_task, advance=1)
+
+    def download_sticker_pack(self, sticker_pack_link, output_folder):
+        """
+        Downloads all stickers from a sticker pack link.
+        """
+        asyncio.run(self._download_sticker_pack(sticker_pack_link, output_folder))
+
+    async def _download_sticker_pack(self, sticker_pack_link, output_folder):
+        """
+        Async pipeline behind download_sticker_pack: one shared client
+        for all API calls and downloads, with a semaphore capping the
+        number of concurrent requests.
+        """
+        pack_name = sticker_pack_link.split('/')[-1]
+        pack_folder = Path(output_folder) / pack_name
+        pack_cache_path = pack_folder / '_pack.json'
+
+        # HTTP/2 multiplexes every getFile and download over a handful of
+        # TLS connections, so a few go a long way.
+        limits = httpx.Limits(max_connections=8)
+        async with httpx.AsyncClient(http2=True, limits=limits) as client:
+            # A fresh cached copy of the pack description (from a previous
+            # run) saves the getStickerSet round-trip on resume.
+            pack_info = self._load_cached_pack_info(pack_cache_path)
+            fetched = pack_info is None
+            if fetched:
+                with self.console.status("[bold green]Fetching sticker pack info...[/bold green]"):
+                    pack_info = await self._get_sticker_set(client, pack_name)
+
+            if not pack_info or not pack_info.get("ok"):
+                self.console.print("[bold red]Could not retrieve sticker pack information. Please check the link and your bot token.[/bold red]")
+                return
+
+            pack_folder.mkdir(parents=True, exist_ok=True)
+            # Only write the cache for responses that actually came from
+            # the network; rewriting a cache hit would bump its mtime and
+            # keep the 24-hour expiry from ever firing.
+            if fetched:
+                with open(pack_cache_path, 'w') as f:
+                    json.dump(pack_info, f)
+
+            self.console.print(Panel(f"[bold cyan]Downloading Sticker Pack:[/bold cyan] [yellow]{pack_info['result']['title']}[/yellow]", border_style="green"))
+
+            stickers = pack_info['result']['stickers']
+
+            # In ZIP mode everything lands in one archive; append mode
+            # lets re-runs resume into it, and the entry set drives the
+            # skip-already-downloaded check.
+            zip_file = None
+            zip_names = None
+            if SAVE_AS_ZIP:
+                zip_file = zipfile.ZipFile(pack_folder / f"{pack_name}.zip", 'a', zipfile.ZIP_STORED)
+                zip_names = set(zip_file.namelist())
+
+            with Progress(
+                TextColumn("[bold blue]{task.description}", justify="right"),
+                BarColumn(bar_width=None),
+                "[progress.percentage]{task.percentage:>3.1f}%",
+                "•",
+                TimeElapsedColumn(),
+                "•",
+                TimeRemainingColumn(),
+                console=self.console,
+                # With 16 stickers completing concurrently, rendering on
+                # every update would spend real time in the terminal; 4
+                # redraws a second is plenty for two bars.
+                refresh_per_second=4
+            ) as progress:
+                download_task = progress.add_task("[green]Downloading[/green]", total=len(stickers))
+                convert_task = progress.add_task("[magenta]Converting[/magenta]", total=len(stickers))
+
+                # Stickers are independent, so they all run as concurrent
+                # coroutines on one event loop; the CPU-bound PNG encodes
+                # still go to the process pool so they use all cores while
+                # downloads continue.
+                semaphore = asyncio.Semaphore(MAX_WORKERS)
+                try:
+                    with ProcessPoolExecutor(max_workers=os.cpu_count()) as convert_pool:
+                        await asyncio.gather(*(
+                            self._process_one_sticker(client, semaphore, convert_pool, sticker,
+                                                      pack_folder, zip_file, zip_names,
+                                                      progress, download_task, convert_task)
+                            for sticker in stickers
+                        ))
+                finally:
+                    if zip_file is not None:
+                        zip_file.close()
+
+        self.console.print(Panel("[bold green]Sticker pack download complete![/bold green]", border_style="green"))
+
+def load_token():
+    """Loads the bot token from the config file."""
+    if os.path.exists(CONFIG_FILE):
+        try:
+            with open(CONFIG_FILE, 'r') as f:
+                config = json.load(f)
+                return config.get("bot_token")
+        except json.JSONDecodeError:
+            return None
+    return None
+
+def save_token(token):
+    """Saves the bot token to the config file."""
+    with open(CONFIG_FILE, 'w') as f:
+        json.dump({"bot_token": token}, f)
+
+def main():
+    """Main function to run the sticker downloader."""
+    console = Console()
+    console.print(Panel(
+        "[bold magenta]TG Sticker Downloader[/bold magenta]",
+        title="[bold blue]Welcome![/bold blue]",
+        subtitle="[bold red]By Johny[/bold red]",
+        border_style="bold purple",
+        expand=False
+    ))
+
+    bot_token = load_token()
+    if not bot_token:
+        console.print("[yellow]No saved bot token found.[/yellow]")
+        bot_token = Prompt.ask("[bold yellow]Please enter your Telegram Bot Token[/bold yellow]")
+        save_token(bot_token)
+        console.print("[bold green]Bot token saved for future sessions.[/bold green]")
+    else:
+        console.print("[bold green]Saved bot token loaded.[/bold green]")
+
+    # Pillow-SIMD ships versions like "9.0.0.post1"; plain Pillow never
+    # carries a ".post" suffix. Shown so users can tell which backend
+    # their conversions run on.
+    if pyvips is not None:
+        image_backend = "pyvips"
+    elif "post" in Image.__version__:
+        image_backend = "Pillow-SIMD"
+    else:
+        image_backend = "Pillow"
+    console.print(f"[dim]Image conversion backend: {image_backend}[/dim]")
+
+    downloader = TelegramStickerDownloader(bot_token)
+    
+    while True:
+        sticker_pack_link = Prompt.ask("\n[bold yellow]Enter the sticker pack link (or type 'quit' to exit)[/bold yellow]")
+        if sticker_pack_link.lower() == 'quit':
+            break
+        
+        downloader.download_sticker_pack(sticker_pack_link, OUTPUT_FOLDER)
+
+if __name__ == '__main__':
     main()
\ No newline at end of file